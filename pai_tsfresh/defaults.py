@@ -1,7 +1,20 @@
 import os
 from multiprocessing import cpu_count
 
-n_cores = int(os.getenv("NUMBER_OF_CPUS") or cpu_count())
+
+def _available_cpu_count():
+    """
+    Return the number of CPUs the process may actually run on. In containers with a CPU
+    affinity mask (docker --cpuset-cpus, kubernetes), cpu_count() reports the host CPUs and
+    would oversubscribe the pool, so the affinity mask is preferred where the platform has one.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return cpu_count()
+
+
+n_cores = int(os.getenv("NUMBER_OF_CPUS") or _available_cpu_count())
 
 CHUNKSIZE = None
 N_PROCESSES = max(1, n_cores // 2)
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+# This file as well as the whole tsfresh package are licenced under the MIT licence (see the LICENCE.txt)
+# Maximilian Christ (maximilianchrist.com), Blue Yonder Gmbh, 2016
+"""
+This module contains numba-compiled drop-in replacements for the feature calculators with the highest
+computational cost. The replacements produce the same values as the pure python/numpy versions in
+:mod:`~pai_tsfresh.feature_extraction.feature_calculators`, but run the hot loops as machine code.
+
+Numba is an optional dependency: if it is not importable, :func:`get_calculator` transparently falls
+back to the original calculators, so nothing else in the package needs to know whether numba is
+installed or not.
+"""
+
+from __future__ import absolute_import, division
+
+import numpy as np
+
+from pai_tsfresh.feature_extraction import feature_calculators
+from pai_tsfresh.feature_extraction.feature_calculators import set_property
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Parameterless calculators whose values all fall out of one fused pass over the array (plus
+# one pass for the centered second moment). Each of them alone would scan the full array, so
+# fusing them cuts the memory traffic on large series accordingly.
+FUSED_CALCULATORS = ("length", "sum_values", "mean", "abs_energy", "minimum", "maximum",
+                     "variance", "standard_deviation")
+
+
+if NUMBA_AVAILABLE:
+
+    # No fastmath on the entropy kernels: NaN-bearing series do reach them, and their results
+    # must stay the deterministic inf/NaN of the numpy originals, which fastmath would allow
+    # LLVM to assume away.
+    @njit(cache=True)
+    def _sample_entropy(x):
+        n = x.shape[0]
+        # np.std on an empty array raises under numba's python error model, while the
+        # original runs through to a NaN result
+        if n == 0:
+            return np.nan
+        tolerance = 0.2 * np.std(x)
+
+        prev = np.zeros(n)
+        curr = np.zeros(n)
+        a = 0.0  # number of matches of length sample_length + 1
+        b = 0.0  # number of matches of length sample_length
+
+        for i in range(n - 1):
+            nj = n - i - 1
+            ts1 = x[i]
+            for jj in range(nj):
+                j = jj + i + 1
+                if abs(x[j] - ts1) < tolerance:
+                    curr[jj] = prev[jj] + 1
+                    a += 1
+                    if j < n - 1:
+                        b += 1
+                else:
+                    curr[jj] = 0
+            for j in range(nj):
+                prev[j] = curr[j]
+
+        # Mirror the numpy division semantics of the original implementation: 0/0 gives
+        # NaN and -log(0) gives inf, while scalar division in compiled code would raise.
+        big_n = n * (n - 1) / 2
+        if big_n == 0:
+            return np.nan
+        if a == 0:
+            return np.inf
+        return -np.log(a / big_n)
+
+    @njit(cache=True)
+    def _approximate_entropy(x, m, r):
+        n = x.shape[0]
+        if n <= m + 1:
+            return 0.0
+
+        phi = np.empty(2)
+        for k in range(2):
+            mm = m + k
+            n_vectors = n - mm + 1
+            log_sum = 0.0
+            for i in range(n_vectors):
+                count = 0
+                for j in range(n_vectors):
+                    dist = 0.0
+                    for l in range(mm):
+                        d = abs(x[i + l] - x[j + l])
+                        if d > dist:
+                            dist = d
+                    if dist <= r:
+                        count += 1
+                log_sum += np.log(count / n_vectors)
+            phi[k] = log_sum / n_vectors
+
+        return abs(phi[0] - phi[1])
+
+    # No fastmath: np.std of a NaN-bearing series is NaN, and the s != 0 branch below has to
+    # see it so NaN input keeps producing NaN like in the original.
+    @njit(cache=True)
+    def _cid_ce(x, normalize):
+        # the original returns sqrt of an empty dot product, while np.std on an empty array
+        # would raise under numba's python error model
+        if x.shape[0] == 0:
+            return 0.0
+        if normalize:
+            s = np.std(x)
+            if s != 0:
+                x = (x - np.mean(x)) / s
+            else:
+                return 0.0
+
+        acc = 0.0
+        for i in range(x.shape[0] - 1):
+            d = x[i + 1] - x[i]
+            acc += d * d
+        return np.sqrt(acc)
+
+    @njit(cache=True, fastmath=True)
+    def _c3(x, lag):
+        n = x.shape[0]
+        if 2 * lag >= n:
+            return 0.0
+
+        acc = 0.0
+        for i in range(n - 2 * lag):
+            acc += x[i + 2 * lag] * x[i + lag] * x[i]
+        return acc / (n - 2 * lag)
+
+    @set_property("high_comp_cost", True)
+    @set_property("fctype", "simple")
+    def sample_entropy(x):
+        """
+        Numba-compiled version of :func:`~pai_tsfresh.feature_extraction.feature_calculators.sample_entropy`.
+
+        :param x: the time series to calculate the feature of
+        :type x: pandas.Series
+        :return: the value of this feature
+        :return type: float
+        """
+        x = np.asarray(x, dtype=np.float64)
+        return _sample_entropy(x)
+
+    @set_property("high_comp_cost", True)
+    @set_property("fctype", "simple")
+    def approximate_entropy(x, m, r):
+        """
+        Numba-compiled version of :func:`~pai_tsfresh.feature_extraction.feature_calculators.approximate_entropy`.
+
+        :param x: the time series to calculate the feature of
+        :type x: pandas.Series
+        :param m: Length of compared run of data
+        :type m: int
+        :param r: Filtering level, must be positive
+        :type r: float
+        :return: Approximate entropy
+        :return type: float
+        """
+        x = np.asarray(x, dtype=np.float64)
+        r *= np.std(x)
+        if r < 0:
+            raise ValueError("Parameter r must be positive.")
+        return _approximate_entropy(x, m, r)
+
+    @set_property("fctype", "simple")
+    def cid_ce(x, normalize):
+        """
+        Numba-compiled version of :func:`~pai_tsfresh.feature_extraction.feature_calculators.cid_ce`.
+
+        :param x: the time series to calculate the feature of
+        :type x: pandas.Series
+        :param normalize: should the time series be z-transformed?
+        :type normalize: bool
+        :return: the value of this feature
+        :return type: float
+        """
+        x = np.asarray(x, dtype=np.float64)
+        return _cid_ce(x, normalize)
+
+    @set_property("fctype", "simple")
+    def c3(x, lag):
+        """
+        Numba-compiled version of :func:`~pai_tsfresh.feature_extraction.feature_calculators.c3`.
+
+        :param x: the time series to calculate the feature of
+        :type x: pandas.Series
+        :param lag: the lag that should be used in the calculation of the feature
+        :type lag: int
+        :return: the value of this feature
+        :return type: float
+        """
+        x = np.asarray(x, dtype=np.float64)
+        return _c3(x, lag)
+
+    # No fastmath here: the fused statistics have to propagate NaNs exactly like the numpy
+    # implementations they replace, and fastmath would allow LLVM to assume there are none.
+    @njit(cache=True)
+    def _fused_stats(x):
+        n = x.shape[0]
+        total = 0.0
+        abs_energy_acc = 0.0
+        minimum = np.inf
+        maximum = -np.inf
+        has_nan = False
+        for i in range(n):
+            v = x[i]
+            if np.isnan(v):
+                has_nan = True
+            total += v
+            abs_energy_acc += v * v
+            if v < minimum:
+                minimum = v
+            if v > maximum:
+                maximum = v
+        if has_nan:
+            minimum = np.nan
+            maximum = np.nan
+
+        mean = total / n
+        # second pass over the centered values, matching the two-pass np.var instead of the
+        # cancellation-prone sum-of-squares shortcut
+        m2 = 0.0
+        for i in range(n):
+            d = x[i] - mean
+            m2 += d * d
+        variance = m2 / n
+
+        return total, mean, abs_energy_acc, minimum, maximum, variance, np.sqrt(variance)
+
+    def fused_default_stats(x):
+        """
+        Compute all calculators named in :data:`FUSED_CALCULATORS` with a single fused pass
+        over the data (plus one pass for the centered second moment), instead of one full array
+        scan per calculator. NaNs propagate into the results exactly like in the individual
+        numpy implementations.
+
+        :param x: the time series to calculate the features of
+        :type x: numpy.ndarray
+        :return: mapping from calculator name to feature value
+        :rtype: dict
+        """
+        x = np.asarray(x, dtype=np.float64)
+        total, mean, abs_energy, minimum, maximum, variance, standard_deviation = _fused_stats(x)
+        return {"length": len(x), "sum_values": total, "mean": mean, "abs_energy": abs_energy,
+                "minimum": minimum, "maximum": maximum, "variance": variance,
+                "standard_deviation": standard_deviation}
+
+    _NUMBA_CALCULATORS = {
+        "sample_entropy": sample_entropy,
+        "approximate_entropy": approximate_entropy,
+        "cid_ce": cid_ce,
+        "c3": c3,
+    }
+else:
+    fused_default_stats = None
+
+    _NUMBA_CALCULATORS = {}
+
+
+def get_calculator(function_name):
+    """
+    Resolve a feature calculator by name, preferring the numba-compiled version if one exists
+    (and numba is installed) and falling back to the original implementation in
+    :mod:`~pai_tsfresh.feature_extraction.feature_calculators` otherwise.
+
+    :param function_name: the name of the feature calculator
+    :type function_name: str
+    :return: the feature calculator function
+    :rtype: callable
+    """
+    try:
+        return _NUMBA_CALCULATORS[function_name]
+    except KeyError:
+        return getattr(feature_calculators, function_name)
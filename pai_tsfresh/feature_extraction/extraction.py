@@ -22,6 +22,10 @@ from pai_tsfresh.utilities.string_manipulation import convert_to_output_format
 
 _logger = logging.getLogger(__name__)
 
+# Below this fraction of populated (id, feature) combinations, the wide result frame is
+# assembled from per-id dicts instead of pivot, which always allocates the dense matrix.
+_DENSE_PIVOT_MIN_DENSITY = 0.3
+
 
 def extract_features(timeseries_container, default_fc_parameters=None,
                      kind_to_fc_parameters=None,
@@ -125,9 +129,6 @@ def extract_features(timeseries_container, default_fc_parameters=None,
     :return: The (maybe imputed) DataFrame containing extracted features.
     :rtype: pandas.DataFrame
     """
-    import logging
-    logging.basicConfig()
-
     # Always use the standardized way of storing the data.
     # See the function normalize_input_to_internal_representation for more information.
     df_melt, column_id, column_kind, column_value = \
@@ -221,7 +222,10 @@ def _do_extraction(df, column_id, column_value, column_kind,
     :return: the extracted features
     :rtype: pd.DataFrame
     """
-    data_in_chunks = [x + (y,) for x, y in df.groupby([column_id, column_kind])[column_value]]
+    # The grouping keys are passed as raw arrays: the normalized frame can carry an index level
+    # named like the id column, which newer pandas versions reject as an ambiguous group key.
+    data_in_chunks = [x + (y,) for x, y in df[column_value].groupby([df[column_id].values,
+                                                                     df[column_kind].values])]
 
     if distributor is None:
 
@@ -242,11 +246,27 @@ def _do_extraction(df, column_id, column_value, column_kind,
 
     # Return a dataframe in the typical form (id as index and feature names as columns)
     result = pd.DataFrame(result)
-    if result.columns.contains("value"):
+    if "value" in result.columns:
         result["value"] = result["value"].astype(float)
 
     if len(result) != 0:
-        result = result.pivot("id", "variable", "value")
+        # pivot materializes a dense n_ids x n_features float matrix, with NaN for every absent
+        # (id, variable) combination. When only a fraction of the combinations is populated
+        # (e.g. with kind_to_fc_parameters and ids that do not share all kinds), the wide frame
+        # is assembled from per-id dicts instead, which only stores the cells that exist.
+        n_ids = result["id"].nunique()
+        n_features = result["variable"].nunique()
+        density = len(result) / (n_ids * n_features)
+        if density < _DENSE_PIVOT_MIN_DENSITY:
+            out = {}
+            for sample_id, variable, value in zip(result["id"].values, result["variable"].values,
+                                                  result["value"].values):
+                out.setdefault(sample_id, {})[variable] = value
+            result = pd.DataFrame.from_dict(out, orient="index")
+            result.index.name = "id"
+            result.columns.name = "variable"
+        else:
+            result = result.pivot(index="id", columns="variable", values="value")
         result.index = result.index.astype(df[column_id].dtype)
 
     return result
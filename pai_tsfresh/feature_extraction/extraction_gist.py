@@ -9,13 +9,21 @@ This module contains the main function to interact with tsfresh: extract feature
 from __future__ import absolute_import, division
 
 import logging
+import sys
 import warnings
+from collections import defaultdict
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    # multiprocessing.shared_memory was only added in python 3.8.
+    shared_memory = None
 
 import numpy as np
 import pandas as pd
 
 from pai_tsfresh import defaults
-from pai_tsfresh.feature_extraction import feature_calculators
+from pai_tsfresh.feature_extraction import _numba_calculators
 from pai_tsfresh.feature_extraction.settings import ComprehensiveFCParameters
 from pai_tsfresh.utilities import dataframe_functions, profiling
 from pai_tsfresh.utilities.distribution import MapDistributor, MultiprocessingDistributor, DistributorBaseClass
@@ -23,6 +31,10 @@ from pai_tsfresh.utilities.string_manipulation import convert_to_output_format
 
 _logger = logging.getLogger(__name__)
 
+# Below this number of time series, extraction runs sequentially: starting a Pool and paying
+# the per-task IPC cost is slower than simply calculating the few chunks in-process.
+_MIN_CHUNKS_FOR_PARALLELISM = 200
+
 
 def extract_features(timeseries_container, default_fc_parameters=None,
                      kind_to_fc_parameters=None,
@@ -34,7 +46,7 @@ def extract_features(timeseries_container, default_fc_parameters=None,
                      profile=defaults.PROFILING,
                      profiling_filename=defaults.PROFILING_FILENAME,
                      profiling_sorting=defaults.PROFILING_SORTING,
-                     distributor=None):
+                     distributor=None, dtype=np.float64):
     """
     Extract features from
     * a :class:`pandas.DataFrame` containing the different time series
@@ -77,7 +89,9 @@ def extract_features(timeseries_container, default_fc_parameters=None,
         singular time series for one id and one kind. If you set the chunksize
         to 10, then it means that one task is to calculate all features for 10
         time series.  If it is set it to None, depending on distributor,
-        heuristics are used to find the optimal chunksize. If you get out of
+        heuristics are used to find the optimal chunksize. For the local
+        parallel case the default is max(1, n_time_series // (n_jobs * 4)),
+        so every worker gets a handful of larger tasks. If you get out of
         memory exceptions, you can try it with the dask distributor and a
         smaller chunksize.
     :type chunksize: None or int
@@ -98,22 +112,26 @@ def extract_features(timeseries_container, default_fc_parameters=None,
              distributor. See the utilities/distribution.py for more information. Leave to None, if you want
              TSFresh to choose the best distributor.
     :type distributor: class
+    :param dtype: Advanced parameter: the dtype the time series values are converted to before
+             the calculators run. The calculators scan the full value array, so with np.float32
+             half as many bytes move through the memory hierarchy and twice as many values fit
+             into one SIMD register. Results of summary statistics are hardly affected, but
+             iterative calculators like the entropy and autocorrelation families can lose the
+             last bits of precision - leave this on np.float64 if exact float64 results matter.
+    :type dtype: numpy.dtype
     :return: The (maybe imputed) DataFrame containing extracted features.
     :rtype: pandas.DataFrame
     """
-    import logging
-    logging.basicConfig()
-
     # Always use the standardized way of storing the data.
     # See the function normalize_input_to_internal_representation for more information.
-    print('Running _normalize_input_to_internal_representation')
+    _logger.debug('Running _normalize_input_to_internal_representation')
     df_melt, column_id, column_kind, column_value = \
         dataframe_functions._normalize_input_to_internal_representation(timeseries_container=timeseries_container,
                                                                         column_id=column_id, column_kind=column_kind,
                                                                         column_sort=column_sort,
                                                                         column_value=column_value)
 
-    print('_normalize_input_to_internal_representation run OK')
+    _logger.debug('_normalize_input_to_internal_representation run OK')
 
     # Use the standard setting if the user did not supply ones himself.
     if default_fc_parameters is None:
@@ -123,7 +141,7 @@ def extract_features(timeseries_container, default_fc_parameters=None,
     if profile:
         profiler = profiling.start_profiling()
 
-    print('Running _do_extraction')
+    _logger.debug('Running _do_extraction')
     with warnings.catch_warnings():
         if not show_warnings:
             warnings.simplefilter("ignore")
@@ -136,13 +154,13 @@ def extract_features(timeseries_container, default_fc_parameters=None,
                                 disable_progressbar=disable_progressbar,
                                 default_fc_parameters=default_fc_parameters,
                                 kind_to_fc_parameters=kind_to_fc_parameters,
-                                distributor=distributor)
+                                distributor=distributor, dtype=dtype)
 
         # Impute the result if requested
         if impute_function is not None:
             impute_function(result)
 
-    print('_do_extraction run OK')
+    _logger.debug('_do_extraction run OK')
 
     # Turn off profiling if it was turned on
     if profile:
@@ -154,7 +172,7 @@ def extract_features(timeseries_container, default_fc_parameters=None,
 
 def _do_extraction(df, column_id, column_value, column_kind,
                    default_fc_parameters, kind_to_fc_parameters,
-                   n_jobs, chunk_size, disable_progressbar, distributor):
+                   n_jobs, chunk_size, disable_progressbar, distributor, dtype=np.float64):
     """
     Wrapper around the _do_extraction_on_chunk, which calls it on all chunks in the data frame.
     A chunk is a subset of the data, with a given kind and id - so a single time series.
@@ -187,166 +205,460 @@ def _do_extraction(df, column_id, column_value, column_kind,
     :param distributor: Advanced parameter:  See the utilities/distribution.py for more information.
                          Leave to None, if you want TSFresh to choose the best distributor.
     :type distributor: DistributorBaseClass
+    :param dtype: the dtype the value buffer is built with. np.float32 halves the memory
+                  traffic of the array scans at the price of the last bits of precision.
+    :type dtype: numpy.dtype
     :return: the extracted features
     :rtype: pd.DataFrame
     """
-    print('Creating data_in_chunks list')
+    _logger.debug('Creating data_in_chunks list')
     # data_in_chunks = [x + (y,) for x, y in df.groupby([column_id, column_kind])[column_value]]
-    import sys
-    import traceback
-
-    # Get some info about the dataframe in terms of the BlockManager mapping
-    # between the row and column indexes and the actual blocks. Each type has a
-    # specialized class in the pandas.core.internals module. Pandas uses the
-    # ObjectBlock class to represent the block containing string columns, and
-    # the FloatBlock class to represent the block containing float columns. For
-    # blocks representing numeric values like integers and floats, pandas
-    # combines the columns and stores them as a NumPy ndarray. The NumPy ndarray
-    # is built around a C array, and the values are stored in a contiguous block
-    # of memory.  Because each data type is stored separately, we can examine
-    # the memory usage by data type. as per
-    # https://www.dataquest.io/blog/pandas-big-data/
-    for dtype in ['float', 'int', 'object']:
-        try:
-            selected_dtype = df.select_dtypes(include=[dtype])
-            mean_usage_b = selected_dtype.memory_usage(deep=True).mean()
-            mean_usage_mb = mean_usage_b / 1024 ** 2
-            print('debug :: average memory usage for {} columns in df: {:03.2f} MB'.format(dtype, mean_usage_mb))
-        except:
-            print('debug :: could not determine average memory usage for {} columns in df')
-
-    # for names, group in df.groupby([column_id, column_kind])[column_value]:
-    grouped = df.groupby([column_id, column_kind])[column_value]
-    print('Dataframe grouped OK')
-
-    # It broke here last time, so instead of accessing the dataframe, let us
-    # just try and get it's size
-    # print('Dataframe grouped keys length :: %s' % str(len(grouped.groups.keys())))
-    print('Getting dataframe grouped size')
-    grouped_size = None
-    try:
-        grouped_size = sys.getsizeof(grouped)
-    except:
-        print(traceback.format_exc())
-        print('error :: failed to execute sys.getsizeof(grouped)')
-    print('Dataframe grouped size :: %s' % str(grouped_size))
-
-#    for names, group in grouped:
-#        count += 1
-#        id_name = names[0]
-#        var_name = names[1]
-    data_in_chunks = []
-    print_out_per = 5000
-    count = 0
-    print('debug :: Enumerating keys in grouped Dataframe, expecting it may break here')
-    try:
-        for i, key in enumerate(grouped.groups.keys()):
-            count += 1
-            try:
-                group = grouped.get_group(key)
-            except:
-                print(traceback.format_exc())
-                print('error :: failed to grouped.get_group(%s)' % str(key))
+
+    # Report the memory usage of the input frame per block type, but only if
+    # debug logging is enabled: memory_usage(deep=True) walks every python
+    # object in the ObjectBlock columns, which is O(rows) per dtype and would
+    # otherwise run on every call before any real work begins.
+    if _logger.isEnabledFor(logging.DEBUG):
+        for block_dtype in ['float', 'int', 'object']:
             try:
-                id_name = str(key[0])
-                var_name = str(key[1])
-                data_in_chunks.append((id_name, str(var_name), group))
-            except:
-                print(traceback.format_exc())
-                print('error :: failed to add data for key %s to data_in_chunks list' % str(key))
-
-            if count % print_out_per == 0:
-                try:
-                    list_length = len(data_in_chunks)
-                    list_size = sys.getsizeof(data_in_chunks)
-                    list_chars = len(str(data_in_chunks))
-                    print('debug :: data_in_chunks :: length %s, size %s, number of chars %s' % (
-                        str(list_length), str(list_size), str(list_chars)))
-                except:
-                    print(traceback.format_exc())
-                    print('error :: failed to print data_in_chunks info at key %s' % str(key))
-    except:
-        print(traceback.format_exc())
-        print('error :: failed to enumerate keys in grouped Dataframe')
-
-    print('Created data_in_chunks list, OK')
-
-    print('Running distributor')
+                selected_dtype = df.select_dtypes(include=[block_dtype])
+                mean_usage_b = selected_dtype.memory_usage(deep=True).mean()
+                mean_usage_mb = mean_usage_b / 1024 ** 2
+                _logger.debug('average memory usage for {} columns in df: {:03.2f} MB'.format(block_dtype,
+                                                                                              mean_usage_mb))
+            except Exception:
+                _logger.debug('could not determine average memory usage for {} columns in df'.format(block_dtype))
+
+    # Compute the trivially vectorizable calculators for all ids of one kind at once, so their
+    # per-series python dispatch never reaches the workers. The remaining calculators go through
+    # the usual per-chunk path. The fast path uses NaN as padding value and is therefore skipped
+    # when the data itself contains NaNs.
+    vectorized_results = {}
+    if not df[column_value].isnull().values.any():
+        vectorized_results, default_fc_parameters, kind_to_fc_parameters = \
+            _do_vectorized_extraction(df=df, column_id=column_id, column_kind=column_kind,
+                                      column_value=column_value,
+                                      default_fc_parameters=default_fc_parameters,
+                                      kind_to_fc_parameters=kind_to_fc_parameters)
+
+    # Split the frame into the single time series with one stable sort on (id, kind) plus a
+    # boundary scan, instead of df.groupby([column_id, column_kind]), which builds a hash map
+    # even though only contiguous slices are needed downstream. Both key columns - typically
+    # object arrays of strings - are factorized to integer codes first, so the sort compares
+    # and the boundary scan equality-checks plain integers instead of python strings. sort=True
+    # makes the code order the lexical order of the labels, and np.lexsort is stable, so the
+    # resulting order is exactly that of a stable sort_values on the original columns and the
+    # row order within each group (already ordered by column_sort during normalization) is
+    # preserved, like it is by groupby. The value column is converted once into a single
+    # C-contiguous buffer - cheap to pickle to the workers and SIMD-friendly inside the
+    # calculators - and every chunk is a zero-copy view into it.
+    # One exception handler around the whole splitter instead of one per step: any failure in
+    # here means the normalized frame is corrupt, so there is nothing to recover per chunk and
+    # the single handler keeps the hot path free of per-iteration handler setup.
+    try:
+        id_codes, id_uniques = pd.factorize(df[column_id].values, sort=True)
+        kind_codes, kind_uniques = pd.factorize(df[column_kind].values, sort=True)
+        # least significant key first: sort by id, then kind within id
+        order = np.lexsort((kind_codes, id_codes))
+        ids = id_codes[order]
+        kinds = kind_codes[order]
+        vals = np.ascontiguousarray(df[column_value].values[order], dtype=dtype)
+
+        shm = None
+        if len(vals):
+            changed = (ids[1:] != ids[:-1]) | (kinds[1:] != kinds[:-1])
+            starts = np.flatnonzero(np.r_[True, changed])
+            ends = np.r_[starts[1:], len(vals)]
+
+            # For only a few time series the Pool start-up and per-task IPC overhead outweighs
+            # any parallel speed-up, so fall back to the sequential map distributor.
+            if distributor is None and n_jobs != 0 and len(starts) < _MIN_CHUNKS_FOR_PARALLELISM:
+                n_jobs = 0
+
+            # When the multiprocessing distributor will be used and posix shared memory is
+            # available, the value buffer is copied into a shared memory segment once, and the
+            # workers receive only (start, end, segment name, dtype) descriptors instead of the
+            # pickled values. The workers attach to the segment in O(1), so the per-chunk IPC
+            # cost no longer scales with the series length.
+            use_shared_memory = shared_memory is not None and distributor is None and n_jobs != 0
+            if use_shared_memory:
+                shm = shared_memory.SharedMemory(create=True, size=vals.nbytes)
+                shm_vals = np.ndarray(vals.shape, dtype=vals.dtype, buffer=shm.buf)
+                np.copyto(shm_vals, vals)
+                data_in_chunks = [(str(id_uniques[ids[start]]), str(kind_uniques[kinds[start]]),
+                                   (int(start), int(end), shm.name, vals.dtype.str))
+                                  for start, end in zip(starts, ends)]
+            else:
+                data_in_chunks = [(str(id_uniques[ids[start]]), str(kind_uniques[kinds[start]]),
+                                   vals[start:end])
+                                  for start, end in zip(starts, ends)]
+        else:
+            data_in_chunks = []
+    except Exception:
+        _logger.exception('Could not split the normalized dataframe into single time series')
+        raise
+
+    _logger.debug('Created data_in_chunks list, OK')
+
+    _logger.debug('Running distributor')
     if distributor is None:
 
         if n_jobs == 0:
             distributor = MapDistributor(disable_progressbar=disable_progressbar,
                                          progressbar_title="Feature Extraction")
         else:
+            # More workers than available CPUs only cause context-switching, so clamp
+            # explicitly requested oversubscription to the affinity mask of the process.
+            available = defaults._available_cpu_count()
+            if n_jobs > available:
+                _logger.warning("Requested n_jobs=%d exceeds the %d available CPUs, "
+                                "using %d workers instead", n_jobs, available, available)
+                n_jobs = available
+
+            # Standard multiprocessing heuristic: hand every worker a few larger tasks instead
+            # of one tiny task per time series, so the Pool dispatch cost is amortized over
+            # many series while the workers still stay balanced. Only applied to the pool built
+            # here - a user-supplied distributor knows its own best chunk size.
+            if chunk_size is None:
+                chunk_size = max(1, len(data_in_chunks) // (n_jobs * 4))
+
+            # Recycle the workers every few hundred tasks: some calculators leave module-level
+            # state behind (statsmodels caches and the like), which would otherwise accumulate
+            # over long extractions.
             distributor = MultiprocessingDistributor(n_workers=n_jobs, disable_progressbar=disable_progressbar,
-                                                     progressbar_title="Feature Extraction")
+                                                     progressbar_title="Feature Extraction",
+                                                     maxtasksperchild=100)
 
-    print('distributor run OK')
+    _logger.debug('distributor run OK')
 
     if not isinstance(distributor, DistributorBaseClass):
         raise ValueError("the passed distributor is not an DistributorBaseClass object")
 
-    kwargs = dict(default_fc_parameters=default_fc_parameters, kind_to_fc_parameters=kind_to_fc_parameters)
-    print('Running distributor.map_reduce')
-    result = distributor.map_reduce(_do_extraction_on_chunk, data=data_in_chunks, chunk_size=chunk_size,
-                                    function_kwargs=kwargs)
-    distributor.close()
-
-    print('distributor.map_reduce run OK')
-
-    # Return a dataframe in the typical form (id as index and feature names as columns)
-    result = pd.DataFrame(result)
-    if result.columns.contains("value"):
-        result["value"] = result["value"].astype(float)
-
+    kwargs = dict(default_fc_parameters=default_fc_parameters, kind_to_fc_parameters=kind_to_fc_parameters,
+                  default_resolved=_resolve_fc_parameters(default_fc_parameters))
+    _logger.debug('Running distributor.map_reduce')
+    try:
+        result = distributor.map_reduce(_do_extraction_on_chunk, data=data_in_chunks, chunk_size=chunk_size,
+                                        function_kwargs=kwargs)
+        distributor.close()
+    finally:
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    _logger.debug('distributor.map_reduce run OK')
+
+    # Return a dataframe in the typical form (id as index and feature names as columns).
+    # The wide frame is assembled directly from the (sample_id, features) pairs the workers
+    # return, instead of building a long-form frame first and pivoting it, which would
+    # hash-group the flattened results a second time and allocate an intermediate frame.
+    out = defaultdict(dict)
+    for sample_id, features in result:
+        out[sample_id].update(features)
+
+    for sample_id, features in vectorized_results.items():
+        out[sample_id].update(features)
+
+    result = pd.DataFrame.from_dict(out, orient='index')
     if len(result) != 0:
-        result = result.pivot("id", "variable", "value")
+        # keep the axis names the pivot of the reference implementation produces
+        result.index.name = "id"
+        result.columns.name = "variable"
         result.index = result.index.astype(df[column_id].dtype)
 
     return result
 
 
-def _do_extraction_on_chunk(chunk, default_fc_parameters, kind_to_fc_parameters):
+# Parameterless calculators which reduce a series to a single number and can therefore be
+# computed for all series of one kind in a single numpy call on a padded (n_ids x max_T)
+# matrix. Each entry maps the calculator name to a function of (matrix, lengths) returning
+# one value per row. The nan-aware variants are used so the NaN padding of ragged series
+# does not influence the result.
+_VECTORIZED_CALCULATORS = {
+    "mean": lambda matrix, lengths: np.nanmean(matrix, axis=1),
+    "median": lambda matrix, lengths: np.nanmedian(matrix, axis=1),
+    "maximum": lambda matrix, lengths: np.nanmax(matrix, axis=1),
+    "minimum": lambda matrix, lengths: np.nanmin(matrix, axis=1),
+    "sum_values": lambda matrix, lengths: np.nansum(matrix, axis=1),
+    "abs_energy": lambda matrix, lengths: np.nansum(matrix * matrix, axis=1),
+    "standard_deviation": lambda matrix, lengths: np.nanstd(matrix, axis=1),
+    "variance": lambda matrix, lengths: np.nanvar(matrix, axis=1),
+    "length": lambda matrix, lengths: lengths,
+}
+
+
+def _do_vectorized_extraction(df, column_id, column_kind, column_value,
+                              default_fc_parameters, kind_to_fc_parameters):
+    """
+    Compute the calculators from :data:`_VECTORIZED_CALCULATORS` for all ids of one kind at once.
+
+    For every kind, the series are stacked into a NaN-padded (n_ids x max_T) matrix and each
+    vectorizable calculator is evaluated with a single numpy call over axis 1, which amortizes
+    the python dispatch over all ids of that kind. The handled calculators are removed from the
+    returned fc_parameters mappings, so the per-chunk extraction does not compute them again.
+
+    :param df: The dataframe in the normalized format which is used for extraction.
+    :type df: pd.DataFrame
+    :param column_id: The name of the id column to group by.
+    :type column_id: str
+    :param column_kind: The name of the column keeping record on the kind of the value.
+    :type column_kind: str
+    :param column_value: The name for the column keeping the value itself.
+    :type column_value: str
+    :param default_fc_parameters: mapping from feature calculator names to parameters.
+    :type default_fc_parameters: dict
+    :param kind_to_fc_parameters: mapping from kind names to fc_parameters objects or None.
+    :type kind_to_fc_parameters: dict
+    :return: a tuple of the vectorized results as a {sample_id: {feature_name: value}} mapping
+             and the reduced default_fc_parameters and kind_to_fc_parameters
+    :rtype: tuple
+    """
+    def vectorizable_names(fc_parameters):
+        return [name for name, parameter_list in fc_parameters.items()
+                if parameter_list is None and name in _VECTORIZED_CALCULATORS]
+
+    out = defaultdict(dict)
+
+    # the kind key is passed as a raw array as well: grouping by label is ambiguous on newer
+    # pandas when the normalized frame carries an index level named like the kind column
+    for kind, df_kind in df.groupby(df[column_kind].values):
+        if kind_to_fc_parameters and kind in kind_to_fc_parameters:
+            fc_parameters = kind_to_fc_parameters[kind]
+        else:
+            fc_parameters = default_fc_parameters
+
+        names = vectorizable_names(fc_parameters)
+        if not names:
+            continue
+
+        # Stack the series of this kind into a NaN-padded wide matrix, with one row per id
+        # and the values in their original order within each series. The grouping key is
+        # passed as a raw array, since the normalized frame can carry an index level with the
+        # same name as the id column, which newer pandas versions treat as ambiguous.
+        values_kind = df_kind[column_value]
+        grouped_kind = values_kind.groupby(df_kind[column_id].values)
+        positions = grouped_kind.cumcount()
+        wide_index = pd.MultiIndex.from_arrays([df_kind[column_id].values, positions.values])
+        wide = pd.Series(values_kind.values, index=wide_index).unstack()
+        matrix = wide.values
+        lengths = grouped_kind.count().reindex(wide.index).values
+
+        for name in names:
+            values = _VECTORIZED_CALCULATORS[name](matrix, lengths)
+            feature_name = str(kind) + "__" + name
+            for sample_id, value in zip(wide.index, values):
+                out[str(sample_id)][feature_name] = value
+
+    # Strip the vectorized calculators out of the parameter mappings handed to the workers.
+    remaining_default = {name: parameter_list for name, parameter_list in default_fc_parameters.items()
+                         if not (parameter_list is None and name in _VECTORIZED_CALCULATORS)}
+    remaining_kind_to_fc = kind_to_fc_parameters
+    if kind_to_fc_parameters:
+        remaining_kind_to_fc = {kind: {name: parameter_list for name, parameter_list in fc_parameters.items()
+                                       if not (parameter_list is None and name in _VECTORIZED_CALCULATORS)}
+                                for kind, fc_parameters in kind_to_fc_parameters.items()}
+
+    return out, remaining_default, remaining_kind_to_fc
+
+
+# Per worker process cache of the attached shared memory segments. The SharedMemory object has
+# to stay referenced as long as arrays built on its buffer are in use, so it is kept here
+# together with the wrapping array. The segments are freed when the main process unlinks them
+# and the worker processes exit.
+_shared_memory_cache = {}
+
+
+def _attach_shared_chunk(descriptor):
+    """
+    Resolve a (start, end, segment name, dtype) descriptor produced by _do_extraction into a
+    numpy view on the shared value buffer, attaching to the shared memory segment on first use
+    per worker process.
+
+    :param descriptor: A tuple of (start, end, segment name, dtype string)
+    :type descriptor: tuple
+    :return: the values of the single time series
+    :rtype: numpy.ndarray
+    """
+    start, end, name, dtype_str = descriptor
+    try:
+        _, vals = _shared_memory_cache[name]
+    except KeyError:
+        shm = shared_memory.SharedMemory(name=name)
+        dtype = np.dtype(dtype_str)
+        vals = np.ndarray((shm.size // dtype.itemsize,), dtype=dtype, buffer=shm.buf)
+        _shared_memory_cache[name] = (shm, vals)
+    return vals[start:end]
+
+
+def _resolve_fc_parameters(fc_parameters):
+    """
+    Turn a mapping from feature calculator names to parameter lists into a list of
+    (function, fctype, parameter_list) triples.
+
+    The calculators are resolved through :mod:`~pai_tsfresh.feature_extraction._numba_calculators`,
+    so the numba-compiled version is picked up where one exists. Resolving once up front saves the
+    worker a getattr plus an fctype attribute lookup per (chunk x feature) combination.
+
+    When numba is installed, the plain reducers from
+    :data:`~pai_tsfresh.feature_extraction._numba_calculators.FUSED_CALCULATORS` are split off
+    into the separately returned name list: the worker computes all of them with one fused pass
+    over the data instead of scanning the array once per calculator.
+
+    For simple calculators with parameters, the parameter list is turned into prebuilt
+    (key string, parameter dict) pairs: the key only depends on the parameters, so building it
+    here instead of in the worker saves one string-formatting call per (chunk x parameter)
+    combination. The keys are interned, so all chunks share one string object per parameter
+    combination. Combiners keep their raw parameter list, since it is passed through to the
+    calculator as-is.
+
+    :param fc_parameters: mapping from feature calculator names to parameters.
+    :type fc_parameters: dict
+    :return: a tuple of a list of (function, fctype, parameter_list) triples, the list of
+             calculator names handled by the fused kernel and the expected number of features
+    :rtype: tuple
+    """
+    resolved = []
+    fused_names = []
+    for function_name, parameter_list in fc_parameters.items():
+        if (_numba_calculators.NUMBA_AVAILABLE and parameter_list is None
+                and function_name in _numba_calculators.FUSED_CALCULATORS):
+            fused_names.append(function_name)
+            continue
+        func = _numba_calculators.get_calculator(function_name)
+        if func.fctype != "combiner" and parameter_list:
+            parameter_list = [(sys.intern(convert_to_output_format(param)), param)
+                              for param in parameter_list]
+        resolved.append((func, func.fctype, parameter_list))
+
+    # Every calculator contributes one feature per parameter combination (or a single one if it
+    # has no parameters), so the worker can preallocate its output list instead of growing it.
+    n_features = len(fused_names) + sum(len(parameter_list) if parameter_list else 1
+                                        for _, _, parameter_list in resolved)
+    return resolved, fused_names, n_features
+
+
+# Simple calculators which return NaN for every parameter setting when the series is constant
+# (or has fewer than two values), but still do their full O(N) work to find that out. The worker
+# short-circuits them on constant input. Only calculators verified to be NaN for all parameters
+# belong here - most calculators return perfectly regular values on constant series (the mean of
+# a constant series is that constant), so a blanket all-NaN skip would be wrong. Combiners are
+# excluded as well, since their output keys are built inside the calculator.
+_NAN_ON_CONSTANT = frozenset(["autocorrelation", "max_langevin_fixed_point"])
+
+
+# Cache of resolved fc_parameters mappings, keyed by the id of the mapping. The mapping object
+# itself is kept in the value to pin it, so its id cannot be recycled for a different mapping
+# while the cache entry is alive. Worker processes receive the same fc_parameters objects for
+# every chunk, so after the first chunk the resolution is a single dict lookup.
+_resolved_fc_parameters_cache = {}
+
+
+def _resolve_fc_parameters_cached(fc_parameters):
+    """
+    Memoized version of :func:`_resolve_fc_parameters`: resolve each fc_parameters mapping only
+    once per process instead of once per chunk.
+
+    :param fc_parameters: mapping from feature calculator names to parameters.
+    :type fc_parameters: dict
+    :return: a tuple of (function, fctype, parameter_list) triples, fused calculator names and
+             the expected number of features
+    :rtype: tuple
+    """
+    key = id(fc_parameters)
+    cached = _resolved_fc_parameters_cache.get(key)
+    if cached is not None and cached[0] is fc_parameters:
+        return cached[1]
+
+    resolved = _resolve_fc_parameters(fc_parameters)
+    if len(_resolved_fc_parameters_cache) > 32:
+        _resolved_fc_parameters_cache.clear()
+    _resolved_fc_parameters_cache[key] = (fc_parameters, resolved)
+    return resolved
+
+
+def _do_extraction_on_chunk(chunk, default_fc_parameters, kind_to_fc_parameters, default_resolved=None):
     """
     Main function of this module: use the feature calculators defined in the
     default_fc_parameters or kind_to_fc_parameters parameters and extract all
     features on the chunk.
-    The chunk consists of the chunk id, the chunk kind and the data (as a Series),
-    which is then converted to a numpy array - so a single time series.
-    Returned is a list of the extracted features. Each one is a dictionary consisting of
-    { "variable": the feature name in the format <kind>__<feature>__<parameters>,
-      "value": the number value of the feature,
-      "id": the id of the chunk }
-    The <parameters> are in the form described in :mod:`~tsfresh.utilities.string_manipulation`.
-    :param chunk: A tuple of sample_id, kind, data
+    The chunk consists of the chunk id, the chunk kind and the data (as a numpy
+    array) - so a single time series.
+    Returned is a list with a single (sample_id, features) pair, where features is a list of
+    (feature name, value) tuples. The feature name has the format <kind>__<feature>__<parameters>,
+    with the <parameters> in the form described in :mod:`~tsfresh.utilities.string_manipulation`.
+    :param chunk: A tuple of sample_id, kind, data, where data is either the values as a numpy
+           array or a shared memory descriptor for :func:`_attach_shared_chunk`.
     :param default_fc_parameters: A dictionary of feature calculators.
     :param kind_to_fc_parameters: A dictionary of fc_parameters for special kinds or None.
+    :param default_resolved: The already resolved (triples, fused names, feature count) tuple for
+           default_fc_parameters, as returned by :func:`_resolve_fc_parameters`. If None, they are
+           resolved here.
     :return: A list of calculated features.
     """
     sample_id, kind, data = chunk
-    data = data.values
+    if not isinstance(data, np.ndarray):
+        data = _attach_shared_chunk(data)
 
     if kind_to_fc_parameters and kind in kind_to_fc_parameters:
-        fc_parameters = kind_to_fc_parameters[kind]
+        resolved, fused_names, n_features = _resolve_fc_parameters_cached(kind_to_fc_parameters[kind])
+    elif default_resolved is not None:
+        resolved, fused_names, n_features = default_resolved
     else:
-        fc_parameters = default_fc_parameters
-
-    def _f():
-        for function_name, parameter_list in fc_parameters.items():
-            func = getattr(feature_calculators, function_name)
-
-            if func.fctype == "combiner":
-                result = func(data, param=parameter_list)
+        resolved, fused_names, n_features = _resolve_fc_parameters_cached(default_fc_parameters)
+
+    kind_str = str(kind)
+
+    # The number of features is known up front, so the output list is preallocated and filled
+    # by index instead of being grown through append, which reallocates along the way. idx can
+    # stay below n_features if a combiner returns fewer entries than it has parameters; the
+    # trailing slots are trimmed at the end.
+    out = [None] * n_features
+    idx = 0
+
+    # All fused reducers come out of one compiled pass over the data, instead of one full
+    # array scan per calculator.
+    if fused_names:
+        fused = _numba_calculators.fused_default_stats(data)
+        for name in fused_names:
+            out[idx] = (f"{kind_str}__{name}", fused[name])
+            idx += 1
+
+    # Whether the series is constant is only determined (with a single vectorized pass) once the
+    # first calculator from _NAN_ON_CONSTANT comes up, so chunks whose parameter set contains
+    # none of them do not pay for the check.
+    is_constant = None
+
+    for func, fctype, parameter_list in resolved:
+
+        skip_as_nan = False
+        if fctype == "simple" and func.__name__ in _NAN_ON_CONSTANT:
+            if is_constant is None:
+                is_constant = data.size < 2 or float(np.ptp(data)) == 0.0
+            skip_as_nan = is_constant
+
+        if skip_as_nan:
+            if parameter_list:
+                result = ((key, np.nan) for key, _ in parameter_list)
+            else:
+                result = [("", np.nan)]
+        elif fctype == "combiner":
+            result = func(data, param=parameter_list)
+        else:
+            if parameter_list:
+                result = ((key, func(data, **param)) for key, param in parameter_list)
+            else:
+                result = [("", func(data))]
+
+        # kind and function name are invariant per calculator, so the prefix is built once
+        # instead of re-coercing and concatenating both strings for every yielded value.
+        base = f"{kind_str}__{func.__name__}"
+        for key, item in result:
+            feature = (f"{base}__{key}" if key else base, item)
+            if idx < n_features:
+                out[idx] = feature
             else:
-                if parameter_list:
-                    result = ((convert_to_output_format(param), func(data, **param)) for param in parameter_list)
-                else:
-                    result = [("", func(data))]
-
-            for key, item in result:
-                feature_name = str(kind) + "__" + func.__name__
-                if key:
-                    feature_name += "__" + str(key)
-                yield {"variable": feature_name, "value": item, "id": sample_id}
-
-    return list(_f())
\ No newline at end of file
+                out.append(feature)
+            idx += 1
+
+    del out[idx:]
+    return [(sample_id, out)]
\ No newline at end of file
@@ -87,7 +87,9 @@ def _estimate_friedrich_coefficients(x, m, r):
     df = pd.DataFrame({'signal': x[:-1], 'delta': np.diff(x)})
     try:
         df['quantiles'] = pd.qcut(df.signal, r)
-    except ValueError:
+    except (ValueError, IndexError):
+        # newer pandas raises IndexError instead of ValueError when the signal is empty
+        # (i.e. for a length-1 series)
         return [np.NaN] * (m + 1)
 
     quantiles = df.groupby('quantiles')
@@ -1526,10 +1528,10 @@ def number_crossing_m(x, m):
     :return: the value of this feature
     :return type: int
     """
-    if not isinstance(x, (np.ndarray, pd.Series)):
-        x = np.asarray(x)
     # From https://stackoverflow.com/questions/3843017/efficiently-detect-sign-changes-in-python
-    positive = x > m
+    # The comparison runs on the raw array: on a Series, newer pandas would align the two
+    # shifted slices by their index labels, comparing every element with itself.
+    positive = np.asarray(x) > m
     return np.where(np.bitwise_xor(positive[1:], positive[:-1]))[0].size
 
 
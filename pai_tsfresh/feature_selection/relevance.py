@@ -217,7 +217,7 @@ def infer_ml_task(y):
     :return: 'classification' or 'regression'
     :rtype: str
     """
-    if y.dtype.kind in np.typecodes['AllInteger'] or y.dtype == np.object:
+    if y.dtype.kind in np.typecodes['AllInteger'] or y.dtype == object:
         ml_task = 'classification'
     else:
         ml_task = 'regression'
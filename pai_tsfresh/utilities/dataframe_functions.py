@@ -160,7 +160,8 @@ def get_range_values_per_column(df):
     :return: Dictionaries mapping column names to max, min, mean values
     :rtype: (dict, dict, dict)
     """
-    data = df.get_values()
+    # .values instead of the removed get_values(), which works on old and new pandas alike
+    data = df.values
     masked = np.ma.masked_invalid(data)
     columns = df.columns
 
@@ -374,7 +375,7 @@ def roll_time_series(df_or_dict, column_id, column_sort, column_kind, rolling_di
     else:
         grouper = [column_id,]
 
-    if column_sort is not None and df[column_sort].dtype != np.object:
+    if column_sort is not None and df[column_sort].dtype != object:
 
         # Require no Nans in column
         if df[column_sort].isnull().any():
@@ -397,6 +398,13 @@ def roll_time_series(df_or_dict, column_id, column_sort, column_kind, rolling_di
     # Roll the data frames if requested
     rolling_direction = np.sign(rolling_direction)
 
+    # Todo: not default for columns_sort to be None
+    if column_sort is None:
+        column_sort = "sort"
+        # added before grouped_data is built: newer pandas snapshots the grouped columns on
+        # first use, so a column added afterwards would not show up in the shifted frames
+        df[column_sort] = range(df.shape[0])
+
     grouped_data = df.groupby(grouper)
     max_timeshift = max_timeshift or grouped_data.count().max().max()
 
@@ -409,11 +417,6 @@ def roll_time_series(df_or_dict, column_id, column_sort, column_kind, rolling_di
     else:
         range_of_shifts = range(-max_timeshift, 1)
 
-    # Todo: not default for columns_sort to be None
-    if column_sort is None:
-        column_sort = "sort"
-        df[column_sort] = range(df.shape[0])
-
     def roll_out_time_series(time_shift):
         # Shift out only the first "time_shift" rows
         df_temp = grouped_data.shift(time_shift)
@@ -331,7 +331,8 @@ class MultiprocessingDistributor(DistributorBaseClass):
     Distributor using a multiprocessing Pool to calculate the jobs in parallel on the local machine.
     """
 
-    def __init__(self, n_workers, disable_progressbar=False, progressbar_title="Feature Extraction"):
+    def __init__(self, n_workers, disable_progressbar=False, progressbar_title="Feature Extraction",
+                 maxtasksperchild=None):
         """
         Creates a new MultiprocessingDistributor instance
 
@@ -341,8 +342,12 @@ class MultiprocessingDistributor(DistributorBaseClass):
         :type disable_progressbar: bool
         :param progressbar_title: the title of the progressbar
         :type progressbar_title: basestring
+        :param maxtasksperchild: after how many tasks a worker process is replaced by a fresh
+            one, bounding the memory growth of long extractions. None (the default) keeps the
+            workers alive for the whole calculation.
+        :type maxtasksperchild: int or None
         """
-        self.pool = Pool(processes=n_workers)
+        self.pool = Pool(processes=n_workers, maxtasksperchild=maxtasksperchild)
         self.n_workers = n_workers
         self.disable_progressbar = disable_progressbar
         self.progressbar_title = progressbar_title
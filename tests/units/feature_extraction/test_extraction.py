@@ -131,6 +131,27 @@ class ExtractionTestCase(DataTestCase):
         self.assertIn("value1__maximum", list(X.columns))
         self.assertIn("value2__maximum", list(X.columns))
 
+    def test_extract_features_with_sparse_results(self):
+        # With ids that do not share kinds, only a fraction of the (id, feature) combinations
+        # exists and the result is assembled without the dense pivot.
+        df = pd.DataFrame({"id": np.repeat([1, 2, 3, 4], 10),
+                           "kind": np.repeat(["a", "b", "c", "d"], 10),
+                           "value": np.arange(40.0)})
+        kind_to_fc_parameters = {"a": {"mean": None, "median": None, "minimum": None, "maximum": None,
+                                       "sum_values": None, "length": None, "variance": None,
+                                       "standard_deviation": None, "abs_energy": None,
+                                       "autocorrelation": [{"lag": 1}]},
+                                 "b": {"maximum": None}, "c": {"maximum": None}, "d": {"maximum": None}}
+
+        X = extract_features(df, column_id="id", column_kind="kind", column_value="value",
+                             kind_to_fc_parameters=kind_to_fc_parameters, n_jobs=self.n_jobs)
+
+        self.assertEqual(len(X), 4)
+        self.assertEqual(X.loc[1, "a__mean"], 4.5)
+        self.assertEqual(X.loc[2, "b__maximum"], 19.0)
+        self.assertTrue(np.isnan(X.loc[2, "a__mean"]))
+        self.assertTrue(np.isnan(X.loc[1, "b__maximum"]))
+
     def test_extract_features_with_and_without_parallelization(self):
         df = self.create_test_data_sample()
 
@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# This file as well as the whole tsfresh package are licenced under the MIT licence (see the LICENCE.txt)
+# Maximilian Christ (maximilianchrist.com), Blue Yonder Gmbh, 2016
+
+from __future__ import absolute_import, division
+
+import unittest
+
+import numpy as np
+import pandas as pd
+import six
+
+from tests.fixtures import DataTestCase
+from pai_tsfresh.feature_extraction import extraction, extraction_gist
+
+
+class ExtractionGistTestCase(DataTestCase):
+    """The unit tests in this module make sure that the gist variant of the extraction behaves like the
+    reference implementation in :mod:`~pai_tsfresh.feature_extraction.extraction`"""
+
+    def setUp(self):
+        self.n_jobs = 1
+
+    def test_extract_features(self):
+        df = self.create_test_data_sample()
+        extracted_features = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                              column_kind="kind", column_value="val",
+                                                              n_jobs=self.n_jobs)
+
+        self.assertIsInstance(extracted_features, pd.DataFrame)
+        self.assertTrue(np.all(extracted_features.a__maximum == np.array([71, 77])))
+        self.assertTrue(np.all(extracted_features.a__sum_values == np.array([691, 1017])))
+        self.assertTrue(np.all(extracted_features.a__abs_energy == np.array([32211, 63167])))
+        self.assertTrue(np.all(extracted_features.b__sum_values == np.array([757, 695])))
+        self.assertTrue(np.all(extracted_features.b__minimum == np.array([3, 1])))
+        self.assertTrue(np.all(extracted_features.b__abs_energy == np.array([36619, 35483])))
+        self.assertTrue(np.all(extracted_features.b__mean == np.array([37.85, 34.75])))
+        self.assertTrue(np.all(extracted_features.b__median == np.array([39.5, 28.0])))
+
+    def test_matches_reference_implementation(self):
+        df = self.create_test_data_sample()
+
+        features_gist = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_kind="kind", column_value="val",
+                                                         n_jobs=0).sort_index()
+        features_reference = extraction.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_kind="kind", column_value="val",
+                                                         n_jobs=0).sort_index()
+
+        six.assertCountEqual(self, features_gist.columns, features_reference.columns)
+
+        for col in features_reference.columns:
+            np.testing.assert_array_almost_equal(features_gist[col], features_reference[col])
+
+    def test_matches_reference_implementation_for_ragged_series(self):
+        df = self.create_one_valued_time_series()
+
+        features_gist = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_kind="kind", column_value="val",
+                                                         n_jobs=0).sort_index()
+        features_reference = extraction.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_kind="kind", column_value="val",
+                                                         n_jobs=0).sort_index()
+
+        six.assertCountEqual(self, features_gist.columns, features_reference.columns)
+
+        for col in features_reference.columns:
+            np.testing.assert_array_almost_equal(features_gist[col], features_reference[col])
+
+    def test_matches_reference_implementation_for_kind_to_fc_parameters(self):
+        df = self.create_test_data_sample()
+        kind_to_fc_parameters = {"a": {"mean": None, "sum_values": None, "autocorrelation": [{"lag": 3}]},
+                                 "b": {"maximum": None, "minimum": None}}
+
+        features_gist = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_kind="kind", column_value="val",
+                                                         kind_to_fc_parameters=kind_to_fc_parameters,
+                                                         n_jobs=0).sort_index()
+        features_reference = extraction.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_kind="kind", column_value="val",
+                                                         kind_to_fc_parameters=kind_to_fc_parameters,
+                                                         n_jobs=0).sort_index()
+
+        six.assertCountEqual(self, features_gist.columns, features_reference.columns)
+
+        for col in features_reference.columns:
+            np.testing.assert_array_almost_equal(features_gist[col], features_reference[col])
+
+    def test_extract_features_with_and_without_parallelization(self):
+        df = self.create_test_data_sample()
+
+        features_parallel = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                             column_kind="kind", column_value="val",
+                                                             n_jobs=self.n_jobs)
+        features_serial = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                           column_kind="kind", column_value="val", n_jobs=0)
+
+        six.assertCountEqual(self, features_parallel.columns, features_serial.columns)
+
+        for col in features_parallel.columns:
+            np.testing.assert_array_almost_equal(features_parallel[col], features_serial[col])
+
+    @unittest.skipIf(extraction_gist.shared_memory is None,
+                     "multiprocessing.shared_memory needs python 3.8+")
+    def test_shared_memory_extraction_matches_serial(self):
+        # enough ids to stay above _MIN_CHUNKS_FOR_PARALLELISM, so n_jobs > 0 without an
+        # explicit distributor really routes the chunks through shared memory
+        n_ids = extraction_gist._MIN_CHUNKS_FOR_PARALLELISM
+        np.random.seed(42)
+        df = pd.DataFrame({"id": np.repeat(range(n_ids), 10),
+                           "sort": list(range(10)) * n_ids,
+                           "val": np.random.normal(0, 1, 10 * n_ids)})
+        fc_parameters = {"sum_values": None, "autocorrelation": [{"lag": 1}],
+                         "cid_ce": [{"normalize": False}]}
+
+        features_parallel = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                             column_value="val",
+                                                             default_fc_parameters=fc_parameters,
+                                                             n_jobs=2)
+        features_serial = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                           column_value="val",
+                                                           default_fc_parameters=fc_parameters, n_jobs=0)
+
+        six.assertCountEqual(self, features_parallel.columns, features_serial.columns)
+
+        features_parallel = features_parallel.sort_index()
+        features_serial = features_serial.sort_index()
+        for col in features_parallel.columns:
+            np.testing.assert_array_almost_equal(features_parallel[col], features_serial[col])
+
+    def test_matches_reference_implementation_for_constant_series(self):
+        # Constant series take the early-skip path for the calculators in _NAN_ON_CONSTANT and
+        # must still produce exactly the values of the reference implementation.
+        df = pd.DataFrame({"id": np.repeat([1, 2], 10), "sort": list(range(10)) * 2,
+                           "val": [3.0] * 10 + [0.0] * 10})
+        fc_parameters = {"autocorrelation": [{"lag": 1}, {"lag": 2}],
+                         "max_langevin_fixed_point": [{"m": 3, "r": 30}],
+                         "mean": None, "length": None, "cid_ce": [{"normalize": True}]}
+
+        features_gist = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_value="val",
+                                                         default_fc_parameters=fc_parameters,
+                                                         n_jobs=0).sort_index()
+        features_reference = extraction.extract_features(df, column_id="id", column_sort="sort",
+                                                         column_value="val",
+                                                         default_fc_parameters=fc_parameters,
+                                                         n_jobs=0).sort_index()
+
+        six.assertCountEqual(self, features_gist.columns, features_reference.columns)
+
+        for col in features_reference.columns:
+            np.testing.assert_array_almost_equal(features_gist[col], features_reference[col])
+
+    def test_extract_features_with_float32_dtype(self):
+        df = self.create_test_data_sample()
+        fc_parameters = {"sum_values": None, "autocorrelation": [{"lag": 1}], "variance": None}
+
+        features_float32 = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                            column_kind="kind", column_value="val",
+                                                            default_fc_parameters=fc_parameters,
+                                                            n_jobs=0, dtype=np.float32).sort_index()
+        features_float64 = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                            column_kind="kind", column_value="val",
+                                                            default_fc_parameters=fc_parameters,
+                                                            n_jobs=0).sort_index()
+
+        six.assertCountEqual(self, features_float32.columns, features_float64.columns)
+
+        for col in features_float64.columns:
+            np.testing.assert_allclose(features_float32[col], features_float64[col], rtol=1e-4)
+
+    def test_extract_index_preservation(self):
+        df = self.create_test_data_nearly_numerical_indices()
+        extracted_features = extraction_gist.extract_features(df, column_id="id", column_sort="sort",
+                                                              column_kind="kind", column_value="val",
+                                                              n_jobs=self.n_jobs)
+
+        self.assertIsInstance(extracted_features, pd.DataFrame)
+        self.assertTrue(set(df.index) == set(extracted_features.index))
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# This file as well as the whole tsfresh package are licenced under the MIT licence (see the LICENCE.txt)
+# Maximilian Christ (maximilianchrist.com), Blue Yonder Gmbh, 2016
+
+from __future__ import absolute_import, division
+
+import unittest
+from unittest import TestCase
+
+import numpy as np
+
+from pai_tsfresh.feature_extraction import _numba_calculators, feature_calculators
+
+
+class GetCalculatorTestCase(TestCase):
+    """Make sure the numba-backed registry resolves every calculator and that the compiled versions
+    agree with the originals"""
+
+    def setUp(self):
+        np.random.seed(42)
+        self.x = np.random.normal(0, 1, 100)
+
+    def test_falls_back_to_original_calculators(self):
+        func = _numba_calculators.get_calculator("mean")
+        self.assertIs(func, feature_calculators.mean)
+
+    def test_resolved_calculators_keep_name_and_fctype(self):
+        for name in ["sample_entropy", "approximate_entropy", "cid_ce", "c3"]:
+            func = _numba_calculators.get_calculator(name)
+            original = getattr(feature_calculators, name)
+            self.assertEqual(func.__name__, original.__name__)
+            self.assertEqual(func.fctype, original.fctype)
+
+    def test_unknown_calculator_raises(self):
+        self.assertRaises(AttributeError, _numba_calculators.get_calculator, "not_a_calculator")
+
+    def test_compiled_versions_match_originals(self):
+        # Without numba installed, get_calculator returns the originals and this reduces to a
+        # sanity check of the registry.
+        cases = [("sample_entropy", {}),
+                 ("approximate_entropy", {"m": 2, "r": 0.3}),
+                 ("cid_ce", {"normalize": True}),
+                 ("cid_ce", {"normalize": False}),
+                 ("c3", {"lag": 2})]
+
+        for name, params in cases:
+            func = _numba_calculators.get_calculator(name)
+            original = getattr(feature_calculators, name)
+            np.testing.assert_almost_equal(func(self.x, **params), original(self.x, **params))
+
+
+@unittest.skipIf(not _numba_calculators.NUMBA_AVAILABLE, "numba is not installed")
+class FusedDefaultStatsTestCase(TestCase):
+    """Make sure the fused single-pass statistics agree with the individual calculators"""
+
+    def assert_matches_originals(self, x):
+        fused = _numba_calculators.fused_default_stats(x)
+        self.assertEqual(sorted(fused.keys()), sorted(_numba_calculators.FUSED_CALCULATORS))
+        for name in _numba_calculators.FUSED_CALCULATORS:
+            original = getattr(feature_calculators, name)
+            np.testing.assert_almost_equal(fused[name], original(x), err_msg=name)
+
+    def test_matches_individual_calculators(self):
+        np.random.seed(42)
+        self.assert_matches_originals(np.random.normal(0, 1, 1000))
+
+    def test_matches_individual_calculators_for_single_value(self):
+        self.assert_matches_originals(np.array([4.2]))
+
+    def test_propagates_nan_like_the_individual_calculators(self):
+        x = np.array([1.0, np.nan, 3.0])
+        fused = _numba_calculators.fused_default_stats(x)
+        self.assertEqual(fused["length"], 3)
+        for name in ["sum_values", "mean", "abs_energy", "minimum", "maximum",
+                     "variance", "standard_deviation"]:
+            self.assertTrue(np.isnan(fused[name]), name)
@@ -475,7 +475,7 @@ class ImputeTestCase(TestCase):
 
         df = pd.DataFrame(np.transpose([[0, 1, 2, np.NaN], [1, np.PINF, 2, np.NaN], [np.NaN, -3, np.NINF, 3]]),
                           columns=["value_a", "value_b", "value_c"])
-        df = df.astype(np.float64, inplace=True)
+        df = df.astype(np.float64)
         dataframe_functions.impute(df)
 
         self.assertEqual(list(df.value_a), [0, 1, 2, 1])
@@ -484,7 +484,7 @@ class ImputeTestCase(TestCase):
 
         df = pd.DataFrame(np.transpose([[0, 1, 2, np.NaN], [1, np.PINF, 2, 3], [np.PINF, -3, np.NINF, 3]]),
                           columns=["value_a", "value_b", "value_c"])
-        df = df.astype(np.float32, inplace=True)
+        df = df.astype(np.float32)
         dataframe_functions.impute(df)
 
         self.assertEqual(list(df.value_a), [0, 1, 2, 1])
@@ -639,7 +639,7 @@ class MakeForecastingFrameTestCase(TestCase):
                                                            kind="test", max_timeshift=1, rolling_direction=1)
 
         expected_y = pd.Series(data=[1, 2, 3], index=pd.DatetimeIndex(["2011-01-01 01:00:00", "2011-01-01 02:00:00",
-                                                                       "2011-01-01 03:00:00"]), name="value")
+                                                                       "2011-01-01 03:00:00"], freq="H"), name="value")
         expected_df = pd.DataFrame({"id": pd.DatetimeIndex(["2011-01-01 01:00:00", "2011-01-01 02:00:00",
                                                             "2011-01-01 03:00:00"]),
                                     "kind": ["test"]*3, "value": [0., 1., 2.],